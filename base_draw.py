@@ -5,17 +5,53 @@ Abstract base class that defines the interface for all drawing backends.
 Concrete implementations (SVG, Turtle, etc.) must inherit from this class.
 """
 
+import re
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional
 
 
+# === SVG-like element parsing shared by the backends ===
+
+SHAPE_TAGS = ("circle", "ellipse", "rect", "line", "polyline", "polygon", "path")
+
+# One pass over the code for every element type: groups 1-2 are shape tag/attributes, 3-4 are text attributes/body
+ELEMENT_RE = re.compile(
+    r'<(' + '|'.join(SHAPE_TAGS) + r')\s+([^>]*)/?>|<text\s+([^>]*)>([^<]*)</text>',
+    re.IGNORECASE,
+)
+ATTR_RE = re.compile(r'(\w+(?:-\w+)*)\s*=\s*["\']([^"\']*)["\']')
+COORD_RE = re.compile(r'[-\d.]+')
+PATH_TOKEN_RE = re.compile(r'[MmLlHhVvCcSsQqTtAaZz]|[-\d.]+')
+
+
+def parse_attributes(attr_string: str) -> dict[str, str]:
+    """Parse SVG attributes from a string."""
+    return dict(ATTR_RE.findall(attr_string))
+
+
+def parse_points(points_str: str) -> list[tuple[float, float]]:
+    """Parse points string into list of coordinate tuples."""
+    # Well-formed points are plain comma/space separated numbers, which split() and float() handle in C
+    try:
+        coords = iter(list(map(float, points_str.replace(",", " ").split())))
+    except ValueError:
+        # Fall back to pulling number-like tokens out of unusual input (units, stray characters, ...)
+        coords = iter(list(map(float, COORD_RE.findall(points_str))))
+    # Pair up x,y values; a dangling coordinate is dropped
+    return list(zip(coords, coords))
+
+
 @dataclass
 class DrawingConfig:
     """Configuration for drawing operations."""
     width: int = 800
     height: int = 800
     background: str = "white"
+    animate: bool = True  # Animate drawing where the backend supports it (turtle); False renders as fast as possible
+    track_groups: bool = False  # Record per-element metadata in object_groups (nothing reads it while rendering)
+    direct_canvas: bool = False  # Turtle: create shapes as Tk canvas items instead of walking the turtle pen
 
 
 class BaseDraw(ABC):
@@ -27,13 +63,18 @@ class BaseDraw(ABC):
     drawing backend without knowing the implementation details.
     """
 
+    # Backends that declare their own __slots__ get instances without a per-instance __dict__
+    __slots__ = ("config", "width", "height", "background", "element_count", "object_groups", "_track_groups")
+
     def __init__(self, config: DrawingConfig):
         self.config = config
         self.width = config.width
         self.height = config.height
         self.background = config.background
         self.element_count = 0
-        self.object_groups: dict[str, list] = {}
+        # Object id -> element records; indexing an unseen id creates its (empty) entry
+        self.object_groups: defaultdict[str, list] = defaultdict(list)
+        self._track_groups = config.track_groups
 
     @property
     @abstractmethod
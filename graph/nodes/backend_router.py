@@ -47,7 +47,8 @@ def route_backend(state: DrawState) -> DrawState:
     Route to the appropriate drawing backend.
     
     Priority:
-    1. Explicit user request (turtle keywords, SVG keywords)
+    1. Explicit user request (turtle keywords, SVG keywords); turtle falls back
+       to Pillow when the state is headless
     2. Default to Pillow (best outcomes for most drawings)
     
     Sets:
@@ -60,6 +61,9 @@ def route_backend(state: DrawState) -> DrawState:
     explicit = _detect_explicit_backend(prompt)
     if explicit:
         backend, reason = explicit
+        if backend == "turtle" and state.get("headless"):
+            # Turtle needs Tk on the main thread; worker threads must not create a Screen
+            backend, reason = "pillow", f"{reason}, but turtle is unavailable in batch mode"
         return {
             **state,
             "backend": backend,
@@ -26,17 +26,20 @@ DEFAULT_CANVAS_HEIGHT = 800
 DEFAULT_BACKGROUND = "white"
 
 
+_RENDERERS = {
+    "pillow": PillowDraw,
+    "svg": SVGDraw,
+    "turtle": TurtleDraw,
+}
+_EXTENSIONS = {"pillow": "png", "svg": "svg", "turtle": "eps"}
+
+
 def _create_renderer(backend: str, config: DrawingConfig):
     """Factory function to create the appropriate drawing backend."""
-    backends = {
-        "svg": SVGDraw,
-        "turtle": TurtleDraw,
-        "pillow": PillowDraw,
-    }
-    if backend not in backends:
+    if backend not in _RENDERERS:
         raise ValueError(f"Unknown backend: {backend}")
     
-    renderer = backends[backend](config)
+    renderer = _RENDERERS[backend](config)
     renderer.initialize()
     return renderer
 
@@ -75,7 +78,8 @@ def execute_one_go(state: DrawState) -> DrawState:
         config = DrawingConfig(
             width=DEFAULT_CANVAS_WIDTH,
             height=DEFAULT_CANVAS_HEIGHT,
-            background=DEFAULT_BACKGROUND
+            background=DEFAULT_BACKGROUND,
+            animate=False,  # Output goes straight to a file, nobody watches it draw
         )
         renderer = _create_renderer(backend, config)
         
@@ -115,9 +119,8 @@ Generate the complete set of drawing elements for this entire scene now."""
         print(f"  [One-Go] Added {elements_added} element(s) to the canvas.")
         
         # Save output
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        ext_map = {"svg": "svg", "turtle": "eps", "pillow": "png"}
-        ext = ext_map.get(backend, "png")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        ext = _EXTENSIONS.get(backend, "png")
         filename = f"graph_one_go_{timestamp}.{ext}"
         filepath = os.path.join(OUTPUT_DIRECTORY, filename)
         
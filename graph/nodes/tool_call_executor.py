@@ -7,6 +7,7 @@ Wraps the core logic from tool-call.py.
 
 import os
 import inspect
+import functools
 from datetime import datetime
 
 from google import genai
@@ -25,33 +26,32 @@ OUTPUT_DIRECTORY = "./outputs"
 DEFAULT_WIDTH = 800
 DEFAULT_HEIGHT = 800
 
+_DRAWERS = {
+    "pillow": PillowDrawer,
+    "svg": SVGDrawer,
+    "turtle": TurtleDrawer,
+}
+_EXTENSIONS = {"pillow": "png", "svg": "svg", "turtle": "eps"}
 
+
+@functools.cache
 def _load_primitive_tools():
-    """Load drawable functions from definitions module."""
-    tools = []
-    for name, func in inspect.getmembers(definitions, inspect.isfunction):
-        if name.startswith("draw_"):
-            tools.append(func)
-    return tools
+    """Load drawable functions from definitions module (once per process)."""
+    return [func for name, func in inspect.getmembers(definitions, inspect.isfunction) if name.startswith("draw_")]
 
 
 def _create_drawer(backend: str, width: int, height: int):
     """Create the appropriate drawer based on backend."""
-    drawers = {
-        "pillow": PillowDrawer,
-        "svg": SVGDrawer,
-        "turtle": TurtleDrawer,
-    }
-    if backend not in drawers:
+    if backend not in _DRAWERS:
         raise ValueError(f"Unknown backend: {backend}")
-    return drawers[backend](width, height)
+    return _DRAWERS[backend](width, height)
 
 
 def _execute_drawing_function(drawer, function_name: str, **kwargs):
     """Execute a drawing function on the drawer."""
     func = getattr(drawer, function_name, None)
     if func:
-        func(**kwargs)
+        func(**definitions.coerce_arguments(function_name, kwargs))
     else:
         print(f"  [Tool-Call] Warning: Function {function_name} not found in drawer.")
 
@@ -99,7 +99,7 @@ def execute_tool_call(state: DrawState) -> DrawState:
                 if part.function_call:
                     has_calls = True
                     function_call = part.function_call
-                    args_dict = {key: value for key, value in function_call.args.items()}
+                    args_dict = dict(function_call.args)
                     print(f"  [Tool-Call] Executing: {function_call.name}({args_dict})")
                     _execute_drawing_function(drawer, function_call.name, **args_dict)
                 elif part.text:
@@ -109,9 +109,8 @@ def execute_tool_call(state: DrawState) -> DrawState:
             raise ValueError("LLM did not return any drawing instructions.")
         
         # Save output
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        ext_map = {"svg": "svg", "turtle": "eps", "pillow": "png"}
-        ext = ext_map.get(backend, "png")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        ext = _EXTENSIONS.get(backend, "png")
         filename = f"graph_tool_call_{timestamp}.{ext}"
         filepath = os.path.join(OUTPUT_DIRECTORY, filename)
         
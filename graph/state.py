@@ -13,6 +13,7 @@ class DrawState(TypedDict, total=False):
     """
     # Input
     original_prompt: str
+    headless: bool  # Running off the main thread (batch mode): Tk-based backends are unavailable
     
     # Prompt Refinement
     refined_prompt: str | None
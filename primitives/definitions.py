@@ -1,3 +1,4 @@
+import functools
 import typing
 
 def draw_line(x1: int, y1: int, x2: int, y2: int, color: str = 'black', width: int = 1):
@@ -84,3 +85,26 @@ def draw_star(center_x: int, center_y: int, outer_radius: int, inner_radius: int
     :param stroke_width: Optional. The width of the outline in pixels. Defaults to 1. Only applies if 'stroke_color' is specified.
     """
     pass
+
+
+@functools.lru_cache(maxsize=None)
+def _int_parameters(function_name: str) -> typing.FrozenSet[str]:
+    func = globals().get(function_name)
+    if func is None:
+        return frozenset()
+    return frozenset(name for name, hint in typing.get_type_hints(func).items() if hint is int)
+
+def coerce_arguments(function_name: str, arguments: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """
+    Casts the arguments of a model function call to int where the primitive declares them as int.
+    The model returns JSON numbers (often floats); the drawers trust their int signatures.
+
+    :param function_name: The name of the primitive being called (e.g., 'draw_circle').
+    :param arguments: The arguments of the function call. Updated in place.
+    :return: The same arguments dict.
+    """
+    for name in _int_parameters(function_name):
+        value = arguments.get(name)
+        if value is not None and value.__class__ is not int:
+            arguments[name] = int(value)
+    return arguments
@@ -0,0 +1,55 @@
+import functools
+import itertools
+import math
+import typing
+
+
+@functools.lru_cache(maxsize=64)
+def _star_directions(points: int) -> typing.Tuple[typing.Tuple[float, float], ...]:
+    # Unit (sin, cos) direction of every vertex; the outer and inner vertices alternate pi/points apart
+    step = math.pi / points
+    sin, cos = math.sin, math.cos
+    return tuple((sin(step * i), cos(step * i)) for i in range(2 * points))
+
+
+def star_vertices(center_x: float, center_y: float, outer_radius: float, inner_radius: float, points: int, y_sign: float = -1.0) -> typing.List[typing.Tuple[float, float]]:
+    """
+    Returns the 2 * points vertices of a star, starting with the outer point along the y axis.
+
+    :param y_sign: -1 puts the first point above the center in a y-down canvas; 1 flips it.
+    """
+    # Fold y_sign into the radii up front so the comprehension does two multiplies per vertex
+    radii = itertools.cycle(((outer_radius, y_sign * outer_radius), (inner_radius, y_sign * inner_radius)))
+    return [(center_x + rx * s, center_y + ry * c) for (rx, ry), (s, c) in zip(radii, _star_directions(points))]
+
+
+@functools.lru_cache(maxsize=4096)
+def _unit_arc(start_angle: float, end_angle: float) -> typing.Tuple[float, float, float, float, int]:
+    # Arcs mostly use a handful of whole-degree angle pairs (0, 90, 180, ...), so cache the
+    # normalization, trig and large-arc flag per pair and leave only the scaling to the caller
+    start_angle %= 360
+    end_angle %= 360
+    # Sweep forward from start to end, wrapping past 360 if needed
+    if end_angle <= start_angle:
+        end_angle += 360
+    start_radians, end_radians = math.radians(start_angle), math.radians(end_angle)
+    large_arc_flag = 1 if (end_angle - start_angle) > 180 else 0
+    return math.cos(start_radians), math.sin(start_radians), math.cos(end_radians), math.sin(end_radians), large_arc_flag
+
+
+def arc_endpoints(center_x: float, center_y: float, radius: float, start_angle: float, end_angle: float) -> typing.Tuple[float, float, float, float, int]:
+    """
+    Returns the (start_x, start_y, end_x, end_y, large_arc_flag) of a forward arc on a circle.
+
+    :param start_angle: The starting angle in degrees. Normalized to [0, 360).
+    :param end_angle: The ending angle in degrees. Wrapped past start_angle when it is not greater.
+    :return: The endpoints, and 1 if the arc spans more than 180 degrees, 0 otherwise.
+    """
+    start_cos, start_sin, end_cos, end_sin, large_arc_flag = _unit_arc(start_angle, end_angle)
+    return (
+        center_x + radius * start_cos,
+        center_y + radius * start_sin,
+        center_x + radius * end_cos,
+        center_y + radius * end_sin,
+        large_arc_flag,
+    )
@@ -1,6 +1,7 @@
 import turtle
 import typing
-import math
+
+from primitives.geometry import star_vertices
 
 class TurtleDrawer:
     def __init__(self, width: int, height: int, background_color: str = 'white'):
@@ -13,16 +14,29 @@ class TurtleDrawer:
 
         self.pen = turtle.Turtle()
         self.pen.speed(0) # Fastest speed
+        self.pen.setundobuffer(None) # Output goes to a file, so skip recording every move for undo()
         self.pen.penup()
+        # Last pen state pushed to turtle, so repeated styles don't re-issue Tk calls
+        self._pen_visible = True # Turtles start out shown
+        self._last_pen_color = None
+        self._last_pen_size = None
 
     def _set_pen_style(self, color: typing.Optional[str], width: int):
         if color and width > 0:
-            self.pen.pencolor(color)
-            self.pen.pensize(width)
-            self.pen.showturtle()
+            if color != self._last_pen_color:
+                self.pen.pencolor(color)
+                self._last_pen_color = color
+            if width != self._last_pen_size:
+                self.pen.pensize(width)
+                self._last_pen_size = width
+            if not self._pen_visible:
+                self.pen.showturtle()
+                self._pen_visible = True
         else:
             self.pen.penup() # Effectively no stroke if no color or width 0
-            self.pen.hideturtle()
+            if self._pen_visible:
+                self.pen.hideturtle()
+                self._pen_visible = False
 
 
     def _set_fill_style(self, fill_color: typing.Optional[str]):
@@ -30,6 +44,18 @@ class TurtleDrawer:
             self.pen.fillcolor(fill_color)
         # No explicit 'unset' fill color, just control begin_fill/end_fill outside
 
+    def _create_polygon(self, vertices: typing.List[typing.Tuple[float, float]], fill_color: typing.Optional[str], stroke_color: typing.Optional[str], stroke_width: int):
+        # Emit the shape as a single canvas polygon (one Tk call) instead of a pen goto and line item per edge.
+        # World coordinates map to canvas coordinates the same way turtle's own _drawpoly does it.
+        xscale, yscale = self.screen.xscale, self.screen.yscale
+        coords = []
+        append = coords.append
+        for x, y in vertices:
+            append(x * xscale)
+            append(-y * yscale)
+        outline = stroke_color if stroke_color and stroke_width > 0 else ""
+        self.screen.getcanvas().create_polygon(coords, fill=fill_color or "", outline=outline, width=stroke_width)
+
     def draw_line(self, x1: int, y1: int, x2: int, y2: int, color: str = 'black', width: int = 1):
         self._set_pen_style(color, int(width))
         self.pen.penup()
@@ -86,81 +112,27 @@ class TurtleDrawer:
 
 
     def draw_triangle(self, x1: int, y1: int, x2: int, y2: int, x3: int, y3: int, fill_color: typing.Optional[str] = None, stroke_color: typing.Optional[str] = None, stroke_width: int = 1):
-        self._set_fill_style(fill_color)
-        self._set_pen_style(stroke_color, int(stroke_width))
-
-        self.pen.penup()
-        self.pen.goto(int(x1), int(y1))
-        
-        if fill_color:
-            self.pen.begin_fill()
-        
         if stroke_color or fill_color:
-            self.pen.pendown()
-            self.pen.goto(int(x2), int(y2))
-            self.pen.goto(int(x3), int(y3))
-            self.pen.goto(int(x1), int(y1)) # Close the triangle
-            self.pen.penup()
-
-        if fill_color:
-            self.pen.end_fill()
+            self._create_polygon([(x1, y1), (x2, y2), (x3, y3)], fill_color, stroke_color, int(stroke_width))
 
 
     def draw_rectangle(self, x: int, y: int, width: int, height: int, fill_color: typing.Optional[str] = None, stroke_color: typing.Optional[str] = None, stroke_width: int = 1):
-        self._set_fill_style(fill_color)
-        self._set_pen_style(stroke_color, int(stroke_width))
-        x, y, width, height = int(x), int(y), int(width), int(height)
-
-        self.pen.penup()
-        self.pen.goto(x, y)
-
-        if fill_color:
-            self.pen.begin_fill()
-
         if stroke_color or fill_color:
-            self.pen.pendown()
-            self.pen.goto(x + width, y)
-            self.pen.goto(x + width, y + height) # Y increases downwards due to setworldcoordinates
-            self.pen.goto(x, y + height)
-            self.pen.goto(x, y) # Close the rectangle
-            self.pen.penup()
-
-        if fill_color:
-            self.pen.end_fill()
+            # Y increases downwards due to setworldcoordinates
+            self._create_polygon([(x, y), (x + width, y), (x + width, y + height), (x, y + height)], fill_color, stroke_color, int(stroke_width))
 
 
     def draw_star(self, center_x: int, center_y: int, outer_radius: int, inner_radius: int, points: int, fill_color: typing.Optional[str] = None, stroke_color: typing.Optional[str] = None, stroke_width: int = 1):
         if points < 3:
             return
 
-        center_x, center_y, outer_radius, inner_radius, points = int(center_x), int(center_y), int(outer_radius), int(inner_radius), int(points)
-        self._set_fill_style(fill_color)
-        self._set_pen_style(stroke_color, int(stroke_width))
-
-        self.pen.penup()
+        center_x, center_y, outer_radius, inner_radius, points, stroke_width = int(center_x), int(center_y), int(outer_radius), int(inner_radius), int(points), int(stroke_width)
 
-        star_points = []
-        for i in range(2 * points):
-            angle = math.pi / points * i
-            r = outer_radius if i % 2 == 0 else inner_radius
-            x = center_x + r * math.sin(angle)
-            y = center_y + r * math.cos(angle) # Y-axis direction is handled by world coordinates
-            star_points.append((x, y))
+        # Y-axis direction is handled by world coordinates
+        star_points = star_vertices(center_x, center_y, outer_radius, inner_radius, points, y_sign=1.0)
 
-        self.pen.goto(star_points[0])
-        
-        if fill_color:
-            self.pen.begin_fill()
-        
         if stroke_color or fill_color:
-            self.pen.pendown()
-            for i in range(1, len(star_points)):
-                self.pen.goto(star_points[i])
-            self.pen.goto(star_points[0]) # Close the shape
-            self.pen.penup()
-        
-        if fill_color:
-            self.pen.end_fill()
+            self._create_polygon(star_points, fill_color, stroke_color, stroke_width)
 
     def save(self, filename: str):
         self.screen.update()
@@ -6,6 +6,8 @@ Main entry point for running the LangGraph-based drawing application.
 
 import os
 import atexit
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from dotenv import load_dotenv
 
@@ -15,8 +17,66 @@ from graph.drawing_graph import run_with_clarification
 import observability
 
 
+# Each worker holds its own in-flight LLM request and canvas, so the pool is kept
+# small rather than sized to the machine.
+_DEFAULT_WORKERS = 4
+
+
+def _report(prompt: str, result: DrawState):
+    """Print the outcome of one batch drawing."""
+    if result.get("error"):
+        print(f"❌ {prompt!r}: {result['error']}")
+    elif result.get("needs_clarification"):
+        print(f"❓ {prompt!r}: needs clarification - {result.get('clarification_question')}")
+    elif result.get("output_path"):
+        print(f"✅ {prompt!r}: {result['output_path']} ({result.get('strategy', 'unknown')}/{result.get('backend', 'unknown')})")
+    else:
+        print(f"⚠️ {prompt!r}: no output was generated.")
+
+
+def run_batch(graph, prompts: list[str], max_workers: int | None = None):
+    """
+    Draw several independent prompts concurrently.
+    
+    Each prompt runs through the graph on its own worker thread. The LLM
+    calls and Pillow's C drawing primitives release the GIL, so scenes
+    overlap instead of queueing. Prompts that need clarification are
+    reported rather than asked about, since there is no user to answer.
+    States are marked headless, so prompts that would route to Turtle
+    (which needs Tk on the main thread) are drawn with Pillow instead.
+    Each prompt's outcome is reported as soon as it finishes; a failure
+    in one prompt does not affect the others.
+    
+    Args:
+        graph: Compiled StateGraph
+        prompts: Prompts to draw
+        max_workers: Worker thread count (defaults to _DEFAULT_WORKERS)
+    """
+    states: list[DrawState] = [
+        {"original_prompt": prompt, "backend": "pillow", "headless": True} for prompt in prompts
+    ]
+    
+    with ThreadPoolExecutor(max_workers=max_workers or _DEFAULT_WORKERS) as pool:
+        futures = {pool.submit(graph.invoke, state): state["original_prompt"] for state in states}
+        for future in as_completed(futures):
+            prompt = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ {prompt!r}: {e}")
+                continue
+            _report(prompt, result)
+
+
 def main():
     """Main application entry point."""
+    parser = argparse.ArgumentParser(description="DrawAI - LangGraph Edition")
+    parser.add_argument("prompts", nargs="*",
+                        help="Prompts to draw in batch mode. Omit to start the interactive session.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Worker threads for batch mode (defaults to {_DEFAULT_WORKERS}).")
+    args = parser.parse_args()
+    
     # Load environment variables
     load_dotenv()
     
@@ -31,6 +91,10 @@ def main():
     
     graph = create_drawing_graph()
     
+    if args.prompts:
+        run_batch(graph, args.prompts, args.workers)
+        return
+    
     print("=" * 60)
     print("🎨 DrawAI - LangGraph Edition")
     print("=" * 60)
@@ -1,24 +1,57 @@
 """
 SVG Drawing Backend
 
-Implements the BaseDraw interface using svgwrite for SVG output.
+Implements the BaseDraw interface by writing SVG markup directly.
 """
 
-import re
-from typing import Optional
+import io
+from typing import Callable, Optional
+from xml.sax.saxutils import escape
 
-import svgwrite
+from base_draw import BaseDraw, DrawingConfig, ELEMENT_RE, parse_attributes, parse_points
 
-from base_draw import BaseDraw, DrawingConfig
+
+# Numeric attributes per element as (name, converter, default), extracted in one pass by _extract
+_CIRCLE_SCHEMA = (("cx", float, 0.0), ("cy", float, 0.0), ("r", float, 10.0), ("stroke-width", float, 1.0))
+_ELLIPSE_SCHEMA = (("cx", float, 0.0), ("cy", float, 0.0), ("rx", float, 10.0), ("ry", float, 10.0), ("stroke-width", float, 1.0))
+_RECT_SCHEMA = (("x", float, 0.0), ("y", float, 0.0), ("width", float, 10.0), ("height", float, 10.0),
+                ("stroke-width", float, 1.0), ("rx", float, None), ("ry", float, None))
+_LINE_SCHEMA = (("x1", float, 0.0), ("y1", float, 0.0), ("x2", float, 0.0), ("y2", float, 0.0), ("stroke-width", float, 1.0))
+_TEXT_SCHEMA = (("x", float, 0.0), ("y", float, 0.0))
+
+_XML_HEADER = '<?xml version="1.0" encoding="utf-8" ?>\n'
+_SVG_NAMESPACES = 'xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events" xmlns:xlink="http://www.w3.org/1999/xlink"'
+_ATTR_ENTITIES = {'"': "&quot;"}
+
+
+def _quote(value) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    return escape(str(value), _ATTR_ENTITIES)
+
+
+def _extract(attrs: dict[str, str], schema: tuple) -> list:
+    """Convert the schema's attributes in order, using the default for any that are missing."""
+    return [convert(attrs[name]) if name in attrs else default for name, convert, default in schema]
 
 
 class SVGDraw(BaseDraw):
-    """SVG drawing backend using svgwrite library."""
+    """SVG drawing backend that emits the markup as strings."""
+
+    __slots__ = ("_header", "_groups", "_target_id", "_target", "_handlers")
 
     def __init__(self, config: DrawingConfig):
         super().__init__(config)
-        self.drawing: Optional[svgwrite.Drawing] = None
-        self._groups: dict[str, svgwrite.container.Group] = {}
+        # Opening <svg> tag plus background; None until initialize()
+        self._header: Optional[str] = None
+        # Serialized elements per object, in group creation order
+        self._groups: dict[str, io.StringIO] = {}
+        # Group and record list of the object drawn last; add_code draws every element into the same one
+        self._target_id: Optional[str] = None
+        self._target: tuple = (None, None)
+        # Bind the per-tag handlers once so add_code dispatches straight to them
+        self._handlers: dict[str, Callable[[str, dict[str, str]], bool]] = {
+            tag: handler.__get__(self) for tag, handler in self._ELEMENT_HANDLERS.items()
+        }
 
     @property
     def backend_name(self) -> str:
@@ -50,329 +83,206 @@ Example valid elements:
 
     def initialize(self) -> None:
         """Initialize the SVG drawing canvas."""
-        self.drawing = svgwrite.Drawing(size=(f"{self.width}px", f"{self.height}px"))
-        # Add background
-        self.drawing.add(
-            self.drawing.rect(insert=(0, 0), size=(self.width, self.height), fill=self.background)
+        self._header = (
+            f'<svg baseProfile="full" height="{self.height}px" version="1.1" width="{self.width}px" {_SVG_NAMESPACES}>'
+            f'<defs /><rect fill="{_quote(self.background)}" height="{self.height}" width="{self.width}" x="0" y="0" />'
         )
         self._groups = {}
+        self._target_id = None
         self.element_count = 1  # Count background
 
-    def get_or_create_group(self, object_id: str) -> svgwrite.container.Group:
+    def get_or_create_group(self, object_id: str) -> io.StringIO:
         """Get or create a group for an object."""
-        if object_id not in self._groups:
-            group = self.drawing.g(id=object_id)
-            self.drawing.add(group)
-            self._groups[object_id] = group
-            if object_id not in self.object_groups:
-                self.object_groups[object_id] = []
-        return self._groups[object_id]
+        group = self._groups.get(object_id)
+        if group is None:
+            group = self._groups[object_id] = io.StringIO()
+            self.object_groups.setdefault(object_id, [])
+        return group
+
+    def _resolve_target(self, object_id: str) -> tuple[io.StringIO, list]:
+        """Return the group and object_groups record for an object, reusing the last one resolved."""
+        if object_id != self._target_id:
+            group = self.get_or_create_group(object_id)
+            self._target = (group, self.object_groups[object_id])
+            self._target_id = object_id
+        return self._target
 
     def add_code(self, object_id: str, code: str) -> int:
         """Parse SVG code and add elements to the drawing."""
+        if self._header is None:
+            raise RuntimeError("SVGDraw.initialize() must be called before add_code()")
+        # Nothing element-shaped (the model answered in prose or markdown): skip the scan
+        if "<" not in code:
+            return 0
         elements_added = 0
-
-        # Parse and add various SVG elements
-        elements_added += self._parse_and_add_circles(object_id, code)
-        elements_added += self._parse_and_add_ellipses(object_id, code)
-        elements_added += self._parse_and_add_rects(object_id, code)
-        elements_added += self._parse_and_add_lines(object_id, code)
-        elements_added += self._parse_and_add_polylines(object_id, code)
-        elements_added += self._parse_and_add_polygons(object_id, code)
-        elements_added += self._parse_and_add_paths(object_id, code)
-        elements_added += self._parse_and_add_texts(object_id, code)
+        # Bind the per-element method lookups to locals up front
+        handlers = self._handlers
+        get_handler = handlers.get
+        add_text = self._add_text
+        for match in ELEMENT_RE.finditer(code):
+            tag, shape_attrs, text_attrs, text_content = match.groups()
+            try:
+                if tag is None:
+                    added = add_text(object_id, parse_attributes(text_attrs), text_content)
+                else:
+                    # Tags are almost always lowercase already; only fold case when the direct lookup misses
+                    handler = get_handler(tag) or handlers[tag.lower()]
+                    added = handler(object_id, parse_attributes(shape_attrs))
+            except (ValueError, KeyError):
+                continue
+            if added:
+                elements_added += 1
 
         self.element_count += elements_added
         return elements_added
 
-    def _parse_attributes(self, attr_string: str) -> dict[str, str]:
-        """Parse SVG attributes from a string."""
-        attrs = {}
-        pattern = r'(\w+(?:-\w+)*)\s*=\s*["\']([^"\']*)["\']'
-        for match in re.finditer(pattern, attr_string):
-            attrs[match.group(1)] = match.group(2)
-        return attrs
-
-    def _parse_points(self, points_str: str) -> list[tuple[float, float]]:
-        """Parse points string into list of coordinate tuples."""
-        points = []
-        coords = re.findall(r'[-\d.]+', points_str)
-        for i in range(0, len(coords) - 1, 2):
-            points.append((float(coords[i]), float(coords[i + 1])))
-        return points
-
-    def _parse_and_add_circles(self, object_id: str, svg_code: str) -> int:
-        """Parse and add circle elements."""
-        count = 0
-        pattern = r'<circle\s+([^>]*)/?>'
-        for match in re.finditer(pattern, svg_code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                cx = float(attrs.get("cx", 0))
-                cy = float(attrs.get("cy", 0))
-                r = float(attrs.get("r", 10))
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = attrs.get("stroke-width", "1")
-
-                if self.draw_circle(object_id, cx, cy, r, fill, stroke, float(stroke_width)):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_ellipses(self, object_id: str, svg_code: str) -> int:
-        """Parse and add ellipse elements."""
-        count = 0
-        pattern = r'<ellipse\s+([^>]*)/?>'
-        for match in re.finditer(pattern, svg_code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                cx = float(attrs.get("cx", 0))
-                cy = float(attrs.get("cy", 0))
-                rx = float(attrs.get("rx", 10))
-                ry = float(attrs.get("ry", 10))
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = attrs.get("stroke-width", "1")
-
-                if self.draw_ellipse(object_id, cx, cy, rx, ry, fill, stroke, float(stroke_width)):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_rects(self, object_id: str, svg_code: str) -> int:
-        """Parse and add rectangle elements."""
-        count = 0
-        pattern = r'<rect\s+([^>]*)/?>'
-        for match in re.finditer(pattern, svg_code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                x = float(attrs.get("x", 0))
-                y = float(attrs.get("y", 0))
-                width = float(attrs.get("width", 10))
-                height = float(attrs.get("height", 10))
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = attrs.get("stroke-width", "1")
-                rx = float(attrs["rx"]) if "rx" in attrs else None
-                ry = float(attrs["ry"]) if "ry" in attrs else None
-
-                if self.draw_rect(object_id, x, y, width, height, fill, stroke, float(stroke_width), rx, ry):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_lines(self, object_id: str, svg_code: str) -> int:
-        """Parse and add line elements."""
-        count = 0
-        pattern = r'<line\s+([^>]*)/?>'
-        for match in re.finditer(pattern, svg_code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                x1 = float(attrs.get("x1", 0))
-                y1 = float(attrs.get("y1", 0))
-                x2 = float(attrs.get("x2", 0))
-                y2 = float(attrs.get("y2", 0))
-                stroke = attrs.get("stroke", "black")
-                stroke_width = attrs.get("stroke-width", "1")
-
-                if self.draw_line(object_id, x1, y1, x2, y2, stroke, float(stroke_width)):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_polylines(self, object_id: str, svg_code: str) -> int:
-        """Parse and add polyline elements."""
-        count = 0
-        pattern = r'<polyline\s+([^>]*)/?>'
-        for match in re.finditer(pattern, svg_code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                points_str = attrs.get("points", "")
-                points = self._parse_points(points_str)
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = attrs.get("stroke-width", "1")
-
-                if self.draw_polyline(object_id, points, fill, stroke, float(stroke_width)):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_polygons(self, object_id: str, svg_code: str) -> int:
-        """Parse and add polygon elements."""
-        count = 0
-        pattern = r'<polygon\s+([^>]*)/?>'
-        for match in re.finditer(pattern, svg_code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                points_str = attrs.get("points", "")
-                points = self._parse_points(points_str)
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = attrs.get("stroke-width", "1")
-
-                if self.draw_polygon(object_id, points, fill, stroke, float(stroke_width)):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_paths(self, object_id: str, svg_code: str) -> int:
-        """Parse and add path elements."""
-        count = 0
-        pattern = r'<path\s+([^>]*)/?>'
-        for match in re.finditer(pattern, svg_code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                d = attrs.get("d", "")
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = attrs.get("stroke-width", "1")
+    def _add_circle(self, object_id: str, attrs: dict[str, str]) -> bool:
+        cx, cy, r, stroke_width = _extract(attrs, _CIRCLE_SCHEMA)
+        return self.draw_circle(object_id, cx, cy, r, attrs.get("fill", "none"), attrs.get("stroke", "black"), stroke_width)
 
-                if self.draw_path(object_id, d, fill, stroke, float(stroke_width)):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_texts(self, object_id: str, svg_code: str) -> int:
-        """Parse and add text elements."""
-        count = 0
-        pattern = r'<text\s+([^>]*)>([^<]*)</text>'
-        for match in re.finditer(pattern, svg_code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            text_content = match.group(2)
-            try:
-                x = float(attrs.get("x", 0))
-                y = float(attrs.get("y", 0))
-                fill = attrs.get("fill", "black")
-                font_size = attrs.get("font-size", "16px")
+    def _add_ellipse(self, object_id: str, attrs: dict[str, str]) -> bool:
+        cx, cy, rx, ry, stroke_width = _extract(attrs, _ELLIPSE_SCHEMA)
+        return self.draw_ellipse(object_id, cx, cy, rx, ry, attrs.get("fill", "none"), attrs.get("stroke", "black"), stroke_width)
 
-                if self.draw_text(object_id, x, y, text_content, fill, font_size):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
+    def _add_rect(self, object_id: str, attrs: dict[str, str]) -> bool:
+        x, y, width, height, stroke_width, rx, ry = _extract(attrs, _RECT_SCHEMA)
+        return self.draw_rect(object_id, x, y, width, height, attrs.get("fill", "none"), attrs.get("stroke", "black"), stroke_width, rx, ry)
+
+    def _add_line(self, object_id: str, attrs: dict[str, str]) -> bool:
+        x1, y1, x2, y2, stroke_width = _extract(attrs, _LINE_SCHEMA)
+        return self.draw_line(object_id, x1, y1, x2, y2, attrs.get("stroke", "black"), stroke_width)
+
+    def _add_polyline(self, object_id: str, attrs: dict[str, str]) -> bool:
+        points = parse_points(attrs.get("points", ""))
+        return self.draw_polyline(object_id, points, attrs.get("fill", "none"), attrs.get("stroke", "black"), float(attrs.get("stroke-width", "1")))
+
+    def _add_polygon(self, object_id: str, attrs: dict[str, str]) -> bool:
+        points = parse_points(attrs.get("points", ""))
+        return self.draw_polygon(object_id, points, attrs.get("fill", "none"), attrs.get("stroke", "black"), float(attrs.get("stroke-width", "1")))
+
+    def _add_path(self, object_id: str, attrs: dict[str, str]) -> bool:
+        return self.draw_path(object_id, attrs.get("d", ""), attrs.get("fill", "none"), attrs.get("stroke", "black"), float(attrs.get("stroke-width", "1")))
+
+    def _add_text(self, object_id: str, attrs: dict[str, str], text_content: str) -> bool:
+        x, y = _extract(attrs, _TEXT_SCHEMA)
+        return self.draw_text(object_id, x, y, text_content, attrs.get("fill", "black"), attrs.get("font-size", "16px"))
+
+    # Tag name -> handler; text is dispatched separately because it also carries a body
+    _ELEMENT_HANDLERS = {
+        "circle": _add_circle,
+        "ellipse": _add_ellipse,
+        "rect": _add_rect,
+        "line": _add_line,
+        "polyline": _add_polyline,
+        "polygon": _add_polygon,
+        "path": _add_path,
+    }
 
     # === Direct drawing methods ===
+    # Attributes are written in alphabetical order, matching the svgwrite output this backend used to produce
 
     def draw_circle(self, object_id: str, cx: float, cy: float, r: float,
                     fill: str = "none", stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw a circle."""
-        try:
-            group = self.get_or_create_group(object_id)
-            circle = self.drawing.circle(
-                center=(cx, cy), r=r, fill=fill, stroke=stroke, stroke_width=stroke_width
-            )
-            group.add(circle)
-            self.object_groups[object_id].append(("circle", {"cx": cx, "cy": cy, "r": r}))
-            return True
-        except Exception:
-            return False
+        group, record = self._resolve_target(object_id)
+        group.write(
+            f'<circle cx="{cx}" cy="{cy}" fill="{_quote(fill)}" r="{r}" stroke="{_quote(stroke)}" stroke-width="{stroke_width}" />'
+        )
+        if self._track_groups:
+            record.append(("circle", {"cx": cx, "cy": cy, "r": r}))
+        return True
 
     def draw_ellipse(self, object_id: str, cx: float, cy: float, rx: float, ry: float,
                      fill: str = "none", stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw an ellipse."""
-        try:
-            group = self.get_or_create_group(object_id)
-            ellipse = self.drawing.ellipse(
-                center=(cx, cy), r=(rx, ry), fill=fill, stroke=stroke, stroke_width=stroke_width
-            )
-            group.add(ellipse)
-            self.object_groups[object_id].append(("ellipse", {"cx": cx, "cy": cy, "rx": rx, "ry": ry}))
-            return True
-        except Exception:
-            return False
+        group, record = self._resolve_target(object_id)
+        group.write(
+            f'<ellipse cx="{cx}" cy="{cy}" fill="{_quote(fill)}" rx="{rx}" ry="{ry}" stroke="{_quote(stroke)}" stroke-width="{stroke_width}" />'
+        )
+        if self._track_groups:
+            record.append(("ellipse", {"cx": cx, "cy": cy, "rx": rx, "ry": ry}))
+        return True
 
     def draw_rect(self, object_id: str, x: float, y: float, width: float, height: float,
                   fill: str = "none", stroke: str = "black", stroke_width: float = 1,
                   rx: Optional[float] = None, ry: Optional[float] = None) -> bool:
         """Draw a rectangle."""
-        try:
-            group = self.get_or_create_group(object_id)
-            rect = self.drawing.rect(
-                insert=(x, y), size=(width, height), fill=fill, stroke=stroke, stroke_width=stroke_width
-            )
-            if rx is not None:
-                rect["rx"] = rx
-            if ry is not None:
-                rect["ry"] = ry
-            group.add(rect)
-            self.object_groups[object_id].append(("rect", {"x": x, "y": y, "width": width, "height": height}))
-            return True
-        except Exception:
-            return False
+        group, record = self._resolve_target(object_id)
+        corners = ""
+        if rx is not None:
+            corners += f' rx="{rx}"'
+        if ry is not None:
+            corners += f' ry="{ry}"'
+        group.write(
+            f'<rect fill="{_quote(fill)}" height="{height}"{corners} stroke="{_quote(stroke)}" stroke-width="{stroke_width}" width="{width}" x="{x}" y="{y}" />'
+        )
+        if self._track_groups:
+            record.append(("rect", {"x": x, "y": y, "width": width, "height": height}))
+        return True
 
     def draw_line(self, object_id: str, x1: float, y1: float, x2: float, y2: float,
                   stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw a line."""
-        try:
-            group = self.get_or_create_group(object_id)
-            line = self.drawing.line(start=(x1, y1), end=(x2, y2), stroke=stroke, stroke_width=stroke_width)
-            group.add(line)
-            self.object_groups[object_id].append(("line", {"x1": x1, "y1": y1, "x2": x2, "y2": y2}))
-            return True
-        except Exception:
-            return False
+        group, record = self._resolve_target(object_id)
+        group.write(f'<line stroke="{_quote(stroke)}" stroke-width="{stroke_width}" x1="{x1}" x2="{x2}" y1="{y1}" y2="{y2}" />')
+        if self._track_groups:
+            record.append(("line", {"x1": x1, "y1": y1, "x2": x2, "y2": y2}))
+        return True
 
     def draw_polyline(self, object_id: str, points: list[tuple[float, float]],
                       fill: str = "none", stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw a polyline."""
-        try:
-            group = self.get_or_create_group(object_id)
-            polyline = self.drawing.polyline(points=points, fill=fill, stroke=stroke, stroke_width=stroke_width)
-            group.add(polyline)
-            self.object_groups[object_id].append(("polyline", {"points": points}))
-            return True
-        except Exception:
-            return False
+        group, record = self._resolve_target(object_id)
+        points_str = " ".join(f"{x},{y}" for x, y in points)
+        group.write(f'<polyline fill="{_quote(fill)}" points="{points_str}" stroke="{_quote(stroke)}" stroke-width="{stroke_width}" />')
+        if self._track_groups:
+            record.append(("polyline", {"points": points}))
+        return True
 
     def draw_polygon(self, object_id: str, points: list[tuple[float, float]],
                      fill: str = "none", stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw a polygon."""
-        try:
-            group = self.get_or_create_group(object_id)
-            polygon = self.drawing.polygon(points=points, fill=fill, stroke=stroke, stroke_width=stroke_width)
-            group.add(polygon)
-            self.object_groups[object_id].append(("polygon", {"points": points}))
-            return True
-        except Exception:
-            return False
+        group, record = self._resolve_target(object_id)
+        points_str = " ".join(f"{x},{y}" for x, y in points)
+        group.write(f'<polygon fill="{_quote(fill)}" points="{points_str}" stroke="{_quote(stroke)}" stroke-width="{stroke_width}" />')
+        if self._track_groups:
+            record.append(("polygon", {"points": points}))
+        return True
 
     def draw_path(self, object_id: str, d: str,
                   fill: str = "none", stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw a path."""
-        try:
-            group = self.get_or_create_group(object_id)
-            path = self.drawing.path(d=d, fill=fill, stroke=stroke, stroke_width=stroke_width)
-            group.add(path)
-            self.object_groups[object_id].append(("path", {"d": d}))
-            return True
-        except Exception:
-            return False
+        group, record = self._resolve_target(object_id)
+        group.write(f'<path d="{_quote(d)}" fill="{_quote(fill)}" stroke="{_quote(stroke)}" stroke-width="{stroke_width}" />')
+        if self._track_groups:
+            record.append(("path", {"d": d}))
+        return True
 
     def draw_text(self, object_id: str, x: float, y: float, text: str,
                   fill: str = "black", font_size: str = "16px") -> bool:
         """Draw text."""
-        try:
-            group = self.get_or_create_group(object_id)
-            text_elem = self.drawing.text(text, insert=(x, y), fill=fill, font_size=font_size)
-            group.add(text_elem)
-            self.object_groups[object_id].append(("text", {"x": x, "y": y, "text": text}))
-            return True
-        except Exception:
-            return False
+        group, record = self._resolve_target(object_id)
+        group.write(f'<text fill="{_quote(fill)}" font-size="{_quote(font_size)}" x="{x}" y="{y}">{escape(text)}</text>')
+        if self._track_groups:
+            record.append(("text", {"x": x, "y": y, "text": text}))
+        return True
 
     def save(self, filepath: str) -> None:
         """Save the SVG to a file."""
-        if self.drawing is not None:
-            self.drawing.saveas(filepath)
+        if self._header is None:
+            return
+        # Stream each group's buffer out rather than concatenating the whole document first
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(_XML_HEADER)
+            f.write(self._header)
+            for object_id, group in self._groups.items():
+                if group.tell():
+                    f.write(f'<g id="{_quote(object_id)}">')
+                    f.write(group.getvalue())
+                    f.write("</g>")
+                else:
+                    f.write(f'<g id="{_quote(object_id)}" />')
+            f.write("</svg>")
 
     def show(self) -> None:
         """Display the drawing (SVG doesn't have a built-in display)."""
@@ -380,5 +290,6 @@ Example valid elements:
 
     def cleanup(self) -> None:
         """Clean up resources."""
-        self.drawing = None
+        self._header = None
         self._groups = {}
+        self._target_id = None
@@ -0,0 +1,87 @@
+"""Tests for batch mode in run_graph."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("langgraph")
+
+import run_graph
+
+
+class StubGraph:
+    """Stands in for the compiled graph; records the states it is invoked with."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.states = []
+        self._lock = threading.Lock()
+
+    def invoke(self, state):
+        with self._lock:
+            self.states.append(state)
+        outcome = self.outcomes[state["original_prompt"]]
+        if isinstance(outcome, Exception):
+            raise outcome
+        if callable(outcome):
+            return outcome()
+        return outcome
+
+
+def test_run_batch_reports_each_prompt(capsys):
+    graph = StubGraph({
+        "a cat": {"output_path": "cat.png", "strategy": "one-go", "backend": "pillow"},
+        "a dog": {"error": "model refused"},
+        "a cow": RuntimeError("connection reset"),
+        "a bird": {"needs_clarification": True, "clarification_question": "Which bird?"},
+    })
+
+    run_graph.run_batch(graph, list(graph.outcomes))
+
+    lines = capsys.readouterr().out.splitlines()
+    assert sorted(lines) == sorted([
+        "✅ 'a cat': cat.png (one-go/pillow)",
+        "❌ 'a dog': model refused",
+        "❌ 'a cow': connection reset",
+        "❓ 'a bird': needs clarification - Which bird?",
+    ])
+    assert all(state["headless"] for state in graph.states)
+
+
+def test_run_batch_reports_in_completion_order(monkeypatch):
+    fast_reported = threading.Event()
+    reported = []
+
+    def report(prompt, result):
+        reported.append(prompt)
+        if prompt == "fast":
+            fast_reported.set()
+
+    def slow():
+        # Only finishes once "fast" has been reported, so a batch that waits
+        # for prompts in submission order would time out here.
+        assert fast_reported.wait(timeout=5)
+        return {"output_path": "slow.png"}
+
+    monkeypatch.setattr(run_graph, "_report", report)
+    graph = StubGraph({"slow": slow, "fast": {"output_path": "fast.png"}})
+
+    run_graph.run_batch(graph, ["slow", "fast"], max_workers=2)
+
+    assert reported == ["fast", "slow"]
+
+
+def test_run_batch_defaults_to_a_small_pool(monkeypatch):
+    seen = {}
+
+    class RecordingExecutor(run_graph.ThreadPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            seen["max_workers"] = max_workers
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(run_graph, "ThreadPoolExecutor", RecordingExecutor)
+
+    run_graph.run_batch(StubGraph({"a cat": {}}), ["a cat"])
+
+    assert seen["max_workers"] == run_graph._DEFAULT_WORKERS
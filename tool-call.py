@@ -1,12 +1,15 @@
+import functools
 import inspect
 import sys
 import os
 import argparse
+import traceback
 import typing
 from pathlib import Path
 
 from google import genai
 from google.genai import types
+from PIL import Image
 
 # Import implementations
 from primitives.pillow_impl import PillowDrawer
@@ -17,36 +20,38 @@ from primitives import definitions
 from dotenv import load_dotenv
 from datetime import datetime
 
-# This will hold the function declarations for the LLM
-PRIMITIVE_TOOLS = []
 OUTPUT_DIRECTORY = "./outputs"
 
+# Drawing backend -> drawer class and output file extension
+_DRAWERS = {"pillow": PillowDrawer, "svg": SVGDrawer, "turtle": TurtleDrawer}
+_EXTENSIONS = {"pillow": "png", "svg": "svg", "turtle": "eps"}
+
 
 # --- Step 1 & 2: Read definitions and generate tools ---
-def _load_primitive_definitions():
+@functools.cache
+def _build_primitive_tools():
     """
     Loads the drawable functions from the definitions module.
     The new SDK can often use the function objects directly.
+    Built once per process; every prompt reuses the same list.
     """
-    global PRIMITIVE_TOOLS
-    for name, func in inspect.getmembers(definitions, inspect.isfunction):
-        if name.startswith("draw_"):
-            PRIMITIVE_TOOLS.append(func)
+    return [func for name, func in inspect.getmembers(definitions, inspect.isfunction) if name.startswith("draw_")]
 
 
 def _execute_drawing_function(drawer_instance, function_name, **kwargs):
     func = getattr(drawer_instance, function_name, None)
     if func:
-        func(**kwargs)
+        func(**definitions.coerce_arguments(function_name, kwargs))
     else:
         print(f"Error: Drawing function {function_name} not found in drawer.")
 
 def main():
     parser = argparse.ArgumentParser(description="Generate drawings using LLM function calls.")
-    parser.add_argument("--drawer_type", type=str, default="pillow", choices=["pillow", "svg", "turtle"],
+    parser.add_argument("--drawer_type", type=str, default="pillow", choices=list(_DRAWERS),
                         help="Choose drawing backend: pillow, svg, or turtle.")
     parser.add_argument("--width", type=int, default=800, help="Canvas width.")
     parser.add_argument("--height", type=int, default=800, help="Canvas height.")
+    parser.add_argument("--verbose", action="store_true", help="Print every function call the LLM makes.")
     args = parser.parse_args()
 
     # Load environment variables from .env file
@@ -61,7 +66,7 @@ def main():
 
     # Create output directory if it doesn't exist
     os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
-    _load_primitive_definitions()
+    primitive_tools = _build_primitive_tools()
 
     print("=" * 60)
     print(f"🖼️  Function-Calling Drawing Application ({args.drawer_type.upper()} backend)")
@@ -79,20 +84,11 @@ def main():
             response = client.models.generate_content(
                 model="models/gemini-flash-latest",
                 contents=prompt,
-                generation_config=types.GenerationConfig(tools=PRIMITIVE_TOOLS)
+                generation_config=types.GenerationConfig(tools=primitive_tools)
             )
 
-            # Instantiate the drawer
-            drawer = None
-            if args.drawer_type == "pillow":
-                drawer = PillowDrawer(args.width, args.height)
-            elif args.drawer_type == "svg":
-                drawer = SVGDrawer(args.width, args.height)
-            elif args.drawer_type == "turtle":
-                drawer = TurtleDrawer(args.width, args.height)
-            else:
-                print("Invalid drawer type selected.")
-                continue
+            # Instantiate the drawer (argparse already restricted drawer_type to the known backends)
+            drawer = _DRAWERS[args.drawer_type](args.width, args.height)
 
             # Process function calls from the LLM response
             if response.candidates and response.candidates[0].content.parts:
@@ -103,8 +99,9 @@ def main():
                         has_calls = True
                         function_call = part.function_call
                         # Convert arguments to a standard dict
-                        args_dict = {key: value for key, value in function_call.args.items()}
-                        print(f"  - Executing: {function_call.name}({args_dict})")
+                        args_dict = dict(function_call.args)
+                        if args.verbose:
+                            print(f"  - Executing: {function_call.name}({args_dict})")
                         _execute_drawing_function(drawer, function_call.name, **args_dict)
                     elif part.text:
                         print(f"LLM said: {part.text}")
@@ -119,12 +116,7 @@ def main():
             # --- Save output ---
             if drawer:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                if args.drawer_type == "svg":
-                    filename = f"tool_call_{timestamp}.svg"
-                elif args.drawer_type == "turtle":
-                    filename = f"tool_call_{timestamp}.eps"
-                else: # pillow
-                    filename = f"tool_call_{timestamp}.png"
+                filename = f"tool_call_{timestamp}.{_EXTENSIONS[args.drawer_type]}"
 
                 filepath = os.path.join(OUTPUT_DIRECTORY, filename)
                 drawer.save(filepath)
@@ -138,7 +130,6 @@ def main():
                 elif args.drawer_type == "pillow":
                     # Try to show the image
                     try:
-                        from PIL import Image
                         Image.open(filepath).show()
                     except Exception:
                         print(f"(Could not automatically open {filepath})")
@@ -148,7 +139,6 @@ def main():
             break
         except Exception as e:
             print(f"\nAn error occurred: {e}")
-            import traceback
             traceback.print_exc()
 
 if __name__ == "__main__":
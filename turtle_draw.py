@@ -7,11 +7,232 @@ Note: Turtle uses a different coordinate system (center origin, y-up) so we conv
 
 import re
 import math
+import functools
 import turtle as t
-from typing import Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Optional
 from pathlib import Path
 
-from base_draw import BaseDraw, DrawingConfig
+from base_draw import BaseDraw, DrawingConfig, ELEMENT_RE, PATH_TOKEN_RE, parse_points
+
+
+def _attr_re(*names: str) -> re.Pattern:
+    """Compile a pattern that only picks out the given attributes (not suffixes of longer names)."""
+    return re.compile(r'(?<![\w-])(' + '|'.join(names) + r')\s*=\s*["\']([^"\']*)["\']')
+
+
+# Per-element attribute patterns: each handler only sees the attributes it uses, so no dict is built
+_CIRCLE_ATTR_RE = _attr_re("cx", "cy", "r", "fill", "stroke", "stroke-width")
+_ELLIPSE_ATTR_RE = _attr_re("cx", "cy", "rx", "ry", "fill", "stroke", "stroke-width")
+_RECT_ATTR_RE = _attr_re("x", "y", "width", "height", "fill", "stroke", "stroke-width")
+_LINE_ATTR_RE = _attr_re("x1", "y1", "x2", "y2", "stroke", "stroke-width")
+_POINTS_ATTR_RE = _attr_re("points", "fill", "stroke", "stroke-width")
+_PATH_ATTR_RE = _attr_re("d", "fill", "stroke", "stroke-width")
+_TEXT_ATTR_RE = _attr_re("x", "y", "fill", "font-size")
+# Unit circle sampled at the ellipse approximation's vertices; draw_ellipse only scales it
+_ELLIPSE_N = 36
+_ELLIPSE_UNIT = tuple(
+    (math.cos(2 * math.pi * i / _ELLIPSE_N), math.sin(2 * math.pi * i / _ELLIPSE_N)) for i in range(_ELLIPSE_N)
+)
+# Screen tracer (n, delay) used while animating
+_ANIMATION_TRACER = (1, 10)
+_FONT_SIZE_RE = re.compile(r'(\d+)')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_color_cached(color: str) -> str:
+    """Normalize a color for turtle; cached since drawings reuse a handful of colors across elements."""
+    if not color or color.lower() == "none":
+        return ""
+    # Remove spaces from color names
+    return color.replace(" ", "").lower()
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_font_size(font_size: str) -> int:
+    """Leading integer of a font-size value such as "16px" (16 if there is none); drawings reuse a few sizes."""
+    size_match = _FONT_SIZE_RE.match(font_size) if font_size else None
+    return int(size_match.group(1)) if size_match else 16
+
+
+# Element parsers: attribute string -> positional arguments for the matching TurtleDraw.draw_* method
+
+def _parse_circle(attr_string: str) -> tuple:
+    cx = cy = 0.0
+    r = 10.0
+    fill, stroke, stroke_width = "none", "black", 1.0
+    for name, value in _CIRCLE_ATTR_RE.findall(attr_string):
+        if name == "cx":
+            cx = float(value)
+        elif name == "cy":
+            cy = float(value)
+        elif name == "r":
+            r = float(value)
+        elif name == "fill":
+            fill = value
+        elif name == "stroke":
+            stroke = value
+        else:
+            stroke_width = float(value)
+    return cx, cy, r, fill, stroke, stroke_width
+
+
+def _parse_ellipse(attr_string: str) -> tuple:
+    cx = cy = 0.0
+    rx = ry = 10.0
+    fill, stroke, stroke_width = "none", "black", 1.0
+    for name, value in _ELLIPSE_ATTR_RE.findall(attr_string):
+        if name == "cx":
+            cx = float(value)
+        elif name == "cy":
+            cy = float(value)
+        elif name == "rx":
+            rx = float(value)
+        elif name == "ry":
+            ry = float(value)
+        elif name == "fill":
+            fill = value
+        elif name == "stroke":
+            stroke = value
+        else:
+            stroke_width = float(value)
+    return cx, cy, rx, ry, fill, stroke, stroke_width
+
+
+def _parse_rect(attr_string: str) -> tuple:
+    x = y = 0.0
+    width = height = 10.0
+    fill, stroke, stroke_width = "none", "black", 1.0
+    for name, value in _RECT_ATTR_RE.findall(attr_string):
+        if name == "x":
+            x = float(value)
+        elif name == "y":
+            y = float(value)
+        elif name == "width":
+            width = float(value)
+        elif name == "height":
+            height = float(value)
+        elif name == "fill":
+            fill = value
+        elif name == "stroke":
+            stroke = value
+        else:
+            stroke_width = float(value)
+    return x, y, width, height, fill, stroke, stroke_width
+
+
+def _parse_line(attr_string: str) -> tuple:
+    x1 = y1 = x2 = y2 = 0.0
+    stroke, stroke_width = "black", 1.0
+    for name, value in _LINE_ATTR_RE.findall(attr_string):
+        if name == "x1":
+            x1 = float(value)
+        elif name == "y1":
+            y1 = float(value)
+        elif name == "x2":
+            x2 = float(value)
+        elif name == "y2":
+            y2 = float(value)
+        elif name == "stroke":
+            stroke = value
+        else:
+            stroke_width = float(value)
+    return x1, y1, x2, y2, stroke, stroke_width
+
+
+def _parse_points_element(attr_string: str) -> tuple:
+    """Shared by polylines and polygons."""
+    points, fill, stroke, stroke_width = "", "none", "black", 1.0
+    for name, value in _POINTS_ATTR_RE.findall(attr_string):
+        if name == "points":
+            points = value
+        elif name == "fill":
+            fill = value
+        elif name == "stroke":
+            stroke = value
+        else:
+            stroke_width = float(value)
+    # A tuple, not a list: the result is shared through the _parse_elements cache and may end up in object_groups
+    return tuple(parse_points(points)), fill, stroke, stroke_width
+
+
+def _parse_path(attr_string: str) -> tuple:
+    d, fill, stroke, stroke_width = "", "none", "black", 1.0
+    for name, value in _PATH_ATTR_RE.findall(attr_string):
+        if name == "d":
+            d = value
+        elif name == "fill":
+            fill = value
+        elif name == "stroke":
+            stroke = value
+        else:
+            stroke_width = float(value)
+    return d, fill, stroke, stroke_width
+
+
+def _parse_text(attr_string: str, text_content: str) -> tuple:
+    x = y = 0.0
+    fill, font_size = "black", "16px"
+    for name, value in _TEXT_ATTR_RE.findall(attr_string):
+        if name == "x":
+            x = float(value)
+        elif name == "y":
+            y = float(value)
+        elif name == "fill":
+            fill = value
+        else:
+            font_size = value
+    return x, y, text_content, fill, font_size
+
+
+# Tag name -> parser; text is dispatched separately because it also carries a body
+_ELEMENT_PARSERS: dict[str, Callable[[str], tuple]] = {
+    "circle": _parse_circle,
+    "ellipse": _parse_ellipse,
+    "rect": _parse_rect,
+    "line": _parse_line,
+    "polyline": _parse_points_element,
+    "polygon": _parse_points_element,
+    "path": _parse_path,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_elements(code: str) -> tuple[tuple[str, tuple], ...]:
+    """
+    Parse SVG-like code into (tag, draw arguments) pairs, skipping malformed elements.
+    Cached so re-rendering or retrying the same snippet only replays the draw calls.
+    """
+    elements = []
+    for match in ELEMENT_RE.finditer(code):
+        tag, shape_attrs, text_attrs, text_content = match.groups()
+        try:
+            if tag is None:
+                elements.append(("text", _parse_text(text_attrs, text_content)))
+                continue
+            # Tags are almost always lowercase already; only fold case when the direct lookup misses
+            parser = _ELEMENT_PARSERS.get(tag)
+            if parser is None:
+                tag = tag.lower()
+                parser = _ELEMENT_PARSERS[tag]
+            elements.append((tag, parser(shape_attrs)))
+        except (ValueError, KeyError):
+            continue
+    return tuple(elements)
+
+
+@dataclass(slots=True)
+class _PathState:
+    """Pen position while walking a path: current point and start of the current subpath."""
+    draw_stroke: bool
+    # Turtle goto and coordinate conversion, looked up once per path rather than once per command
+    goto: Callable[[float, float], None]
+    to_turtle: Callable[[float, float], tuple[float, float]]
+    x: float = 0.0
+    y: float = 0.0
+    start_x: float = 0.0
+    start_y: float = 0.0
 
 
 class TurtleDraw(BaseDraw):
@@ -22,6 +243,29 @@ class TurtleDraw(BaseDraw):
         self.screen: Optional[t.Screen] = None
         self.turtle: Optional[t.Turtle] = None
         self._initialized = False
+        # Tk canvas that shapes are drawn on directly in direct_canvas mode, and its world -> pixel scale
+        self._canvas = None
+        self._canvas_scale = (1.0, 1.0)
+        # Canvas center offsets used by every SVG -> turtle coordinate conversion
+        self._half_width = self.width / 2
+        self._half_height = self.height / 2
+        # Element tag -> draw method that replays the arguments _parse_elements produced for it
+        self._drawers: dict[str, Callable[..., bool]] = {
+            "circle": self.draw_circle,
+            "ellipse": self.draw_ellipse,
+            "rect": self.draw_rect,
+            "line": self.draw_line,
+            "polyline": self.draw_polyline,
+            "polygon": self.draw_polygon,
+            "path": self.draw_path,
+            "text": self.draw_text,
+        }
+        self._path_commands: dict[str, tuple[Callable[..., int], bool]] = {
+            cmd: (handler.__get__(self), relative) for cmd, (handler, relative) in self._PATH_COMMANDS.items()
+        }
+        # Last values handed to the turtle, so consecutive elements in the same style skip the Tk round trip
+        self._pen_state: dict[str, object] = {}
+        self._reset_pen_state()
 
     @property
     def backend_name(self) -> str:
@@ -63,16 +307,18 @@ Example valid elements:
         Turtle: (0,0) at center, y increases upward
         """
         # Translate so center of canvas is at origin
-        tx = x - self.width / 2
-        ty = self.height / 2 - y  # Flip y-axis
+        tx = x - self._half_width
+        ty = self._half_height - y  # Flip y-axis
         return tx, ty
 
+    def _svg_to_turtle_points(self, points: list[tuple[float, float]]) -> list[tuple[float, float]]:
+        """Convert a whole point list to turtle coordinates in one pass (see _svg_to_turtle_coords)."""
+        half_width, half_height = self._half_width, self._half_height
+        return [(x - half_width, half_height - y) for x, y in points]
+
     def _parse_color(self, color: str) -> str:
         """Parse and validate color, returning a turtle-compatible color."""
-        if not color or color.lower() == "none":
-            return ""
-        # Remove spaces from color names
-        return color.replace(" ", "").lower()
+        return _parse_color_cached(color)
 
     def initialize(self) -> None:
         """Initialize the turtle graphics window."""
@@ -84,10 +330,20 @@ Example valid elements:
         )
         self.screen.bgcolor(self._parse_color(self.background) or "white")
         self.screen.title("LLM Drawing - Turtle Backend")
-        # Enable animation with a small delay (0 = fastest but still visible)
-        self.screen.tracer(1, 10)  # Update after every shape, 10ms delay
+        if self.config.animate:
+            # Enable animation with a small delay (0 = fastest but still visible)
+            self.screen.tracer(*_ANIMATION_TRACER)  # Update after every shape, 10ms delay
+        else:
+            # No animation: only the explicit update() at the end of add_code touches the canvas
+            self.screen.tracer(0, 0)
+
+        # Direct canvas mode: circles, lines, polylines and polygons (and so rects/ellipses) become canvas items;
+        # paths and text still go through the turtle
+        self._canvas = self.screen.getcanvas() if self.config.direct_canvas else None
+        self._canvas_scale = (self.screen.xscale, self.screen.yscale)
 
         self.turtle = t.Turtle()
+        self._reset_pen_state()
         self.turtle.speed(3)  # Medium speed for visibility
         self.turtle.hideturtle()
         self.turtle.penup()
@@ -95,24 +351,52 @@ Example valid elements:
         self._initialized = True
         self.element_count = 0
 
+    @contextmanager
+    def _single_frame(self):
+        """Render everything drawn inside the block in one canvas refresh instead of one per goto."""
+        if not self.config.animate:
+            yield
+            return
+        self.screen.tracer(0, 0)
+        try:
+            yield
+        finally:
+            # Turning the tracer back on also flushes the batched shape to the canvas
+            self.screen.tracer(*_ANIMATION_TRACER)
+
+    def _reset_pen_state(self) -> None:
+        """Forget the cached pen settings (new or discarded turtle)."""
+        self._pen_state = {"color": None, "size": None, "fill": None}
+
+    def _set_pen_color(self, color: str) -> None:
+        if color != self._pen_state["color"]:
+            self.turtle.pencolor(color)
+            self._pen_state["color"] = color
+
+    def _set_pen_size(self, size: float) -> None:
+        if size != self._pen_state["size"]:
+            self.turtle.pensize(size)
+            self._pen_state["size"] = size
+
+    def _set_fill_color(self, color: str) -> None:
+        if color != self._pen_state["fill"]:
+            self.turtle.fillcolor(color)
+            self._pen_state["fill"] = color
+
     def get_or_create_group(self, object_id: str) -> None:
         """Turtle doesn't have groups, but we track elements per object."""
-        if object_id not in self.object_groups:
-            self.object_groups[object_id] = []
+        self.object_groups.setdefault(object_id, [])
 
     def add_code(self, object_id: str, code: str) -> int:
         """Parse SVG-like code and draw using turtle."""
+        # Nothing element-shaped (the model answered in prose or markdown): skip the scan and the screen refresh
+        if "<" not in code:
+            return 0
         elements_added = 0
-
-        # Parse and add various elements
-        elements_added += self._parse_and_add_circles(object_id, code)
-        elements_added += self._parse_and_add_ellipses(object_id, code)
-        elements_added += self._parse_and_add_rects(object_id, code)
-        elements_added += self._parse_and_add_lines(object_id, code)
-        elements_added += self._parse_and_add_polylines(object_id, code)
-        elements_added += self._parse_and_add_polygons(object_id, code)
-        elements_added += self._parse_and_add_paths(object_id, code)
-        elements_added += self._parse_and_add_texts(object_id, code)
+        drawers = self._drawers
+        for tag, args in _parse_elements(code):
+            if drawers[tag](object_id, *args):
+                elements_added += 1
 
         # Update screen
         if self.screen:
@@ -121,180 +405,27 @@ Example valid elements:
         self.element_count += elements_added
         return elements_added
 
-    def _parse_attributes(self, attr_string: str) -> dict[str, str]:
-        """Parse SVG attributes from a string."""
-        attrs = {}
-        pattern = r'(\w+(?:-\w+)*)\s*=\s*["\']([^"\']*)["\']'
-        for match in re.finditer(pattern, attr_string):
-            attrs[match.group(1)] = match.group(2)
-        return attrs
-
-    def _parse_points(self, points_str: str) -> list[tuple[float, float]]:
-        """Parse points string into list of coordinate tuples."""
-        points = []
-        coords = re.findall(r'[-\d.]+', points_str)
-        for i in range(0, len(coords) - 1, 2):
-            points.append((float(coords[i]), float(coords[i + 1])))
-        return points
-
-    def _parse_and_add_circles(self, object_id: str, code: str) -> int:
-        count = 0
-        pattern = r'<circle\s+([^>]*)/?>'
-        for match in re.finditer(pattern, code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                cx = float(attrs.get("cx", 0))
-                cy = float(attrs.get("cy", 0))
-                r = float(attrs.get("r", 10))
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = float(attrs.get("stroke-width", "1"))
-                if self.draw_circle(object_id, cx, cy, r, fill, stroke, stroke_width):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_ellipses(self, object_id: str, code: str) -> int:
-        count = 0
-        pattern = r'<ellipse\s+([^>]*)/?>'
-        for match in re.finditer(pattern, code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                cx = float(attrs.get("cx", 0))
-                cy = float(attrs.get("cy", 0))
-                rx = float(attrs.get("rx", 10))
-                ry = float(attrs.get("ry", 10))
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = float(attrs.get("stroke-width", "1"))
-                if self.draw_ellipse(object_id, cx, cy, rx, ry, fill, stroke, stroke_width):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_rects(self, object_id: str, code: str) -> int:
-        count = 0
-        pattern = r'<rect\s+([^>]*)/?>'
-        for match in re.finditer(pattern, code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                x = float(attrs.get("x", 0))
-                y = float(attrs.get("y", 0))
-                width = float(attrs.get("width", 10))
-                height = float(attrs.get("height", 10))
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = float(attrs.get("stroke-width", "1"))
-                if self.draw_rect(object_id, x, y, width, height, fill, stroke, stroke_width):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_lines(self, object_id: str, code: str) -> int:
-        count = 0
-        pattern = r'<line\s+([^>]*)/?>'
-        for match in re.finditer(pattern, code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                x1 = float(attrs.get("x1", 0))
-                y1 = float(attrs.get("y1", 0))
-                x2 = float(attrs.get("x2", 0))
-                y2 = float(attrs.get("y2", 0))
-                stroke = attrs.get("stroke", "black")
-                stroke_width = float(attrs.get("stroke-width", "1"))
-                if self.draw_line(object_id, x1, y1, x2, y2, stroke, stroke_width):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_polylines(self, object_id: str, code: str) -> int:
-        count = 0
-        pattern = r'<polyline\s+([^>]*)/?>'
-        for match in re.finditer(pattern, code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                points_str = attrs.get("points", "")
-                points = self._parse_points(points_str)
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = float(attrs.get("stroke-width", "1"))
-                if self.draw_polyline(object_id, points, fill, stroke, stroke_width):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_polygons(self, object_id: str, code: str) -> int:
-        count = 0
-        pattern = r'<polygon\s+([^>]*)/?>'
-        for match in re.finditer(pattern, code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                points_str = attrs.get("points", "")
-                points = self._parse_points(points_str)
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = float(attrs.get("stroke-width", "1"))
-                if self.draw_polygon(object_id, points, fill, stroke, stroke_width):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_paths(self, object_id: str, code: str) -> int:
-        count = 0
-        pattern = r'<path\s+([^>]*)/?>'
-        for match in re.finditer(pattern, code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            try:
-                d = attrs.get("d", "")
-                fill = attrs.get("fill", "none")
-                stroke = attrs.get("stroke", "black")
-                stroke_width = float(attrs.get("stroke-width", "1"))
-                if self.draw_path(object_id, d, fill, stroke, stroke_width):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
-    def _parse_and_add_texts(self, object_id: str, code: str) -> int:
-        count = 0
-        pattern = r'<text\s+([^>]*)>([^<]*)</text>'
-        for match in re.finditer(pattern, code, re.IGNORECASE):
-            attrs = self._parse_attributes(match.group(1))
-            text_content = match.group(2)
-            try:
-                x = float(attrs.get("x", 0))
-                y = float(attrs.get("y", 0))
-                fill = attrs.get("fill", "black")
-                font_size = attrs.get("font-size", "16px")
-                if self.draw_text(object_id, x, y, text_content, fill, font_size):
-                    count += 1
-            except (ValueError, KeyError):
-                continue
-        return count
-
     # === Direct drawing methods ===
 
     def draw_circle(self, object_id: str, cx: float, cy: float, r: float,
                     fill: str = "none", stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw a circle using turtle."""
+        if self._canvas is not None:
+            return self._canvas_circle(object_id, cx, cy, r, fill, stroke, stroke_width)
         try:
             self.get_or_create_group(object_id)
-            tx, ty = self._svg_to_turtle_coords(cx, cy - r)  # Start at bottom of circle
+            # turtle.circle() draws counterclockwise around a center r units to the turtle's left (it faces east),
+            # so start at the bottom of the circle: SVG y + r
+            tx, ty = self._svg_to_turtle_coords(cx, cy + r)
 
             self.turtle.penup()
-            self.turtle.goto(tx, ty - r)  # Position at bottom
+            self.turtle.goto(tx, ty)  # Position at bottom
 
             # Set stroke
             stroke_color = self._parse_color(stroke)
             if stroke_color:
-                self.turtle.pencolor(stroke_color)
-                self.turtle.pensize(stroke_width)
+                self._set_pen_color(stroke_color)
+                self._set_pen_size(stroke_width)
                 self.turtle.pendown()
             else:
                 self.turtle.penup()
@@ -302,7 +433,7 @@ Example valid elements:
             # Set fill
             fill_color = self._parse_color(fill)
             if fill_color:
-                self.turtle.fillcolor(fill_color)
+                self._set_fill_color(fill_color)
                 self.turtle.begin_fill()
 
             # Draw circle
@@ -312,7 +443,8 @@ Example valid elements:
                 self.turtle.end_fill()
 
             self.turtle.penup()
-            self.object_groups[object_id].append(("circle", {"cx": cx, "cy": cy, "r": r}))
+            if self._track_groups:
+                self.object_groups[object_id].append(("circle", {"cx": cx, "cy": cy, "r": r}))
             return True
         except Exception:
             return False
@@ -320,17 +452,14 @@ Example valid elements:
     def draw_ellipse(self, object_id: str, cx: float, cy: float, rx: float, ry: float,
                      fill: str = "none", stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw an ellipse using turtle (approximated with polygon)."""
+        if abs(rx - ry) < 1e-6:
+            # A circle after all: let turtle draw the native arc instead of a 36-segment polygon
+            return self.draw_circle(object_id, cx, cy, rx, fill, stroke, stroke_width)
         try:
             self.get_or_create_group(object_id)
 
             # Generate points for ellipse approximation
-            points = []
-            num_segments = 36
-            for i in range(num_segments):
-                angle = 2 * math.pi * i / num_segments
-                x = cx + rx * math.cos(angle)
-                y = cy + ry * math.sin(angle)
-                points.append((x, y))
+            points = [(cx + rx * c, cy + ry * s) for c, s in _ELLIPSE_UNIT]
 
             return self.draw_polygon(object_id, points, fill, stroke, stroke_width)
         except Exception:
@@ -358,6 +487,8 @@ Example valid elements:
     def draw_line(self, object_id: str, x1: float, y1: float, x2: float, y2: float,
                   stroke: str = "black", stroke_width: float = 1) -> bool:
         """Draw a line using turtle."""
+        if self._canvas is not None:
+            return self._canvas_line(object_id, x1, y1, x2, y2, stroke, stroke_width)
         try:
             self.get_or_create_group(object_id)
             tx1, ty1 = self._svg_to_turtle_coords(x1, y1)
@@ -369,13 +500,14 @@ Example valid elements:
 
             self.turtle.penup()
             self.turtle.goto(tx1, ty1)
-            self.turtle.pencolor(stroke_color)
-            self.turtle.pensize(stroke_width)
+            self._set_pen_color(stroke_color)
+            self._set_pen_size(stroke_width)
             self.turtle.pendown()
             self.turtle.goto(tx2, ty2)
             self.turtle.penup()
 
-            self.object_groups[object_id].append(("line", {"x1": x1, "y1": y1, "x2": x2, "y2": y2}))
+            if self._track_groups:
+                self.object_groups[object_id].append(("line", {"x1": x1, "y1": y1, "x2": x2, "y2": y2}))
             return True
         except Exception:
             return False
@@ -385,38 +517,42 @@ Example valid elements:
         """Draw a polyline using turtle."""
         if not points:
             return False
+        if self._canvas is not None:
+            return self._canvas_polyline(object_id, points, fill, stroke, stroke_width)
 
         try:
-            self.get_or_create_group(object_id)
+            with self._single_frame():
+                self.get_or_create_group(object_id)
 
-            stroke_color = self._parse_color(stroke)
-            fill_color = self._parse_color(fill)
+                stroke_color = self._parse_color(stroke)
+                fill_color = self._parse_color(fill)
 
-            # Convert first point
-            tx, ty = self._svg_to_turtle_coords(points[0][0], points[0][1])
-            self.turtle.penup()
-            self.turtle.goto(tx, ty)
+                # Convert every vertex up front
+                turtle_points = self._svg_to_turtle_points(points)
+                goto = self.turtle.goto
+                self.turtle.penup()
+                goto(*turtle_points[0])
 
-            if stroke_color:
-                self.turtle.pencolor(stroke_color)
-                self.turtle.pensize(stroke_width)
-                self.turtle.pendown()
+                if stroke_color:
+                    self._set_pen_color(stroke_color)
+                    self._set_pen_size(stroke_width)
+                    self.turtle.pendown()
 
-            if fill_color:
-                self.turtle.fillcolor(fill_color)
-                self.turtle.begin_fill()
+                if fill_color:
+                    self._set_fill_color(fill_color)
+                    self.turtle.begin_fill()
 
-            # Draw to each point
-            for px, py in points[1:]:
-                tx, ty = self._svg_to_turtle_coords(px, py)
-                self.turtle.goto(tx, ty)
+                # Draw to each point
+                for tx, ty in turtle_points[1:]:
+                    goto(tx, ty)
 
-            if fill_color:
-                self.turtle.end_fill()
+                if fill_color:
+                    self.turtle.end_fill()
 
-            self.turtle.penup()
-            self.object_groups[object_id].append(("polyline", {"points": points}))
-            return True
+                self.turtle.penup()
+                if self._track_groups:
+                    self.object_groups[object_id].append(("polyline", {"points": points}))
+                return True
         except Exception:
             return False
 
@@ -425,42 +561,45 @@ Example valid elements:
         """Draw a polygon using turtle."""
         if not points:
             return False
+        if self._canvas is not None:
+            return self._canvas_polygon(object_id, points, fill, stroke, stroke_width)
 
         try:
-            self.get_or_create_group(object_id)
+            with self._single_frame():
+                self.get_or_create_group(object_id)
 
-            stroke_color = self._parse_color(stroke)
-            fill_color = self._parse_color(fill)
+                stroke_color = self._parse_color(stroke)
+                fill_color = self._parse_color(fill)
 
-            # Convert first point
-            tx, ty = self._svg_to_turtle_coords(points[0][0], points[0][1])
-            self.turtle.penup()
-            self.turtle.goto(tx, ty)
+                # Convert every vertex up front
+                turtle_points = self._svg_to_turtle_points(points)
+                goto = self.turtle.goto
+                self.turtle.penup()
+                goto(*turtle_points[0])
 
-            if stroke_color:
-                self.turtle.pencolor(stroke_color)
-                self.turtle.pensize(stroke_width)
-                self.turtle.pendown()
+                if stroke_color:
+                    self._set_pen_color(stroke_color)
+                    self._set_pen_size(stroke_width)
+                    self.turtle.pendown()
 
-            if fill_color:
-                self.turtle.fillcolor(fill_color)
-                self.turtle.begin_fill()
+                if fill_color:
+                    self._set_fill_color(fill_color)
+                    self.turtle.begin_fill()
 
-            # Draw to each point
-            for px, py in points[1:]:
-                tx, ty = self._svg_to_turtle_coords(px, py)
-                self.turtle.goto(tx, ty)
+                # Draw to each point
+                for tx, ty in turtle_points[1:]:
+                    goto(tx, ty)
 
-            # Close polygon
-            tx, ty = self._svg_to_turtle_coords(points[0][0], points[0][1])
-            self.turtle.goto(tx, ty)
+                # Close polygon
+                goto(*turtle_points[0])
 
-            if fill_color:
-                self.turtle.end_fill()
+                if fill_color:
+                    self.turtle.end_fill()
 
-            self.turtle.penup()
-            self.object_groups[object_id].append(("polygon", {"points": points}))
-            return True
+                self.turtle.penup()
+                if self._track_groups:
+                    self.object_groups[object_id].append(("polygon", {"points": points}))
+                return True
         except Exception:
             return False
 
@@ -471,142 +610,138 @@ Example valid elements:
         This is a simplified implementation that handles basic path commands.
         """
         try:
-            self.get_or_create_group(object_id)
+            with self._single_frame():
+                self.get_or_create_group(object_id)
 
-            stroke_color = self._parse_color(stroke)
-            fill_color = self._parse_color(fill)
+                stroke_color = self._parse_color(stroke)
+                fill_color = self._parse_color(fill)
 
-            if stroke_color:
-                self.turtle.pencolor(stroke_color)
-                self.turtle.pensize(stroke_width)
+                if stroke_color:
+                    self._set_pen_color(stroke_color)
+                    self._set_pen_size(stroke_width)
 
-            if fill_color:
-                self.turtle.fillcolor(fill_color)
-                self.turtle.begin_fill()
+                if fill_color:
+                    self._set_fill_color(fill_color)
+                    self.turtle.begin_fill()
 
-            # Parse path commands (simplified)
-            self._execute_path_commands(d, stroke_color is not None)
+                # Parse path commands (simplified)
+                self._execute_path_commands(d, stroke_color is not None)
 
-            if fill_color:
-                self.turtle.end_fill()
+                if fill_color:
+                    self.turtle.end_fill()
 
-            self.turtle.penup()
-            self.object_groups[object_id].append(("path", {"d": d}))
-            return True
+                self.turtle.penup()
+                if self._track_groups:
+                    self.object_groups[object_id].append(("path", {"d": d}))
+                return True
         except Exception:
             return False
 
     def _execute_path_commands(self, d: str, draw_stroke: bool) -> None:
         """Execute SVG path commands."""
         # Tokenize the path
-        tokens = re.findall(r'[MmLlHhVvCcSsQqTtAaZz]|[-\d.]+', d)
-
-        current_x, current_y = 0.0, 0.0
-        start_x, start_y = 0.0, 0.0
+        tokens = PATH_TOKEN_RE.findall(d)
+        state = _PathState(draw_stroke, self.turtle.goto, self._svg_to_turtle_coords)
+        commands = self._path_commands
+        n = len(tokens)
         i = 0
 
-        while i < len(tokens):
-            cmd = tokens[i]
-
-            if cmd in 'Mm':
-                # Move to
+        while i < n:
+            command = commands.get(tokens[i])
+            if command is None:
+                # Stray number (continuation of previous command) - skip it
                 i += 1
-                x, y = float(tokens[i]), float(tokens[i + 1])
-                i += 2
-                if cmd == 'm':  # Relative
-                    x += current_x
-                    y += current_y
-                tx, ty = self._svg_to_turtle_coords(x, y)
-                self.turtle.penup()
-                self.turtle.goto(tx, ty)
-                current_x, current_y = x, y
-                start_x, start_y = x, y
-                if draw_stroke:
-                    self.turtle.pendown()
-
-            elif cmd in 'Ll':
-                # Line to
-                i += 1
-                x, y = float(tokens[i]), float(tokens[i + 1])
-                i += 2
-                if cmd == 'l':  # Relative
-                    x += current_x
-                    y += current_y
-                tx, ty = self._svg_to_turtle_coords(x, y)
-                self.turtle.goto(tx, ty)
-                current_x, current_y = x, y
-
-            elif cmd in 'Hh':
-                # Horizontal line
-                i += 1
-                x = float(tokens[i])
-                i += 1
-                if cmd == 'h':  # Relative
-                    x += current_x
-                tx, ty = self._svg_to_turtle_coords(x, current_y)
-                self.turtle.goto(tx, ty)
-                current_x = x
-
-            elif cmd in 'Vv':
-                # Vertical line
-                i += 1
-                y = float(tokens[i])
-                i += 1
-                if cmd == 'v':  # Relative
-                    y += current_y
-                tx, ty = self._svg_to_turtle_coords(current_x, y)
-                self.turtle.goto(tx, ty)
-                current_y = y
-
-            elif cmd in 'Zz':
-                # Close path
-                i += 1
-                tx, ty = self._svg_to_turtle_coords(start_x, start_y)
-                self.turtle.goto(tx, ty)
-                current_x, current_y = start_x, start_y
+            else:
+                handler, relative = command
+                i = handler(tokens, i + 1, state, relative)
 
-            elif cmd in 'CcQqSsTt':
-                # Curves - approximate with lines for simplicity
-                # Skip the control points and just go to the end point
-                i += 1
-                if cmd in 'Cc':  # Cubic bezier (6 params)
-                    if i + 5 < len(tokens):
-                        x, y = float(tokens[i + 4]), float(tokens[i + 5])
-                        i += 6
-                        if cmd == 'c':
-                            x += current_x
-                            y += current_y
-                        tx, ty = self._svg_to_turtle_coords(x, y)
-                        self.turtle.goto(tx, ty)
-                        current_x, current_y = x, y
-                elif cmd in 'Qq':  # Quadratic bezier (4 params)
-                    if i + 3 < len(tokens):
-                        x, y = float(tokens[i + 2]), float(tokens[i + 3])
-                        i += 4
-                        if cmd == 'q':
-                            x += current_x
-                            y += current_y
-                        tx, ty = self._svg_to_turtle_coords(x, y)
-                        self.turtle.goto(tx, ty)
-                        current_x, current_y = x, y
-                elif cmd in 'SsTt':  # Smooth curves (4 or 2 params)
-                    if i + 1 < len(tokens):
-                        x, y = float(tokens[i]), float(tokens[i + 1])
-                        i += 2
-                        if cmd.islower():
-                            x += current_x
-                            y += current_y
-                        tx, ty = self._svg_to_turtle_coords(x, y)
-                        self.turtle.goto(tx, ty)
-                        current_x, current_y = x, y
-
-            elif cmd in 'Aa':
-                # Arc - simplified, skip for now
-                i += 8  # Skip all arc parameters
+    # Path command handlers: each takes the index of its first parameter and returns the index after its last
 
-            else:
-                # Try to parse as number (continuation of previous command)
-                i += 1
+    def _path_move(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        x, y = float(tokens[i]), float(tokens[i + 1])
+        if relative:
+            x += state.x
+            y += state.y
+        self.turtle.penup()
+        state.goto(*state.to_turtle(x, y))
+        state.x, state.y = x, y
+        state.start_x, state.start_y = x, y
+        if state.draw_stroke:
+            self.turtle.pendown()
+        return i + 2
+
+    def _path_line(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        x, y = float(tokens[i]), float(tokens[i + 1])
+        if relative:
+            x += state.x
+            y += state.y
+        state.goto(*state.to_turtle(x, y))
+        state.x, state.y = x, y
+        return i + 2
+
+    def _path_horizontal(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        x = float(tokens[i])
+        if relative:
+            x += state.x
+        state.goto(*state.to_turtle(x, state.y))
+        state.x = x
+        return i + 1
+
+    def _path_vertical(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        y = float(tokens[i])
+        if relative:
+            y += state.y
+        state.goto(*state.to_turtle(state.x, y))
+        state.y = y
+        return i + 1
+
+    def _path_close(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        state.goto(*state.to_turtle(state.start_x, state.start_y))
+        state.x, state.y = state.start_x, state.start_y
+        return i
+
+    def _path_curve_to(self, tokens: list[str], i: int, state: "_PathState", relative: bool,
+                       param_count: int, end_offset: int) -> int:
+        """Approximate a curve with a straight line to the point at end_offset; skip it if truncated."""
+        if i + param_count > len(tokens):
+            return i
+        x, y = float(tokens[i + end_offset]), float(tokens[i + end_offset + 1])
+        if relative:
+            x += state.x
+            y += state.y
+        state.goto(*state.to_turtle(x, y))
+        state.x, state.y = x, y
+        return i + param_count
+
+    def _path_cubic(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        # Cubic bezier (6 params): skip the control points and just go to the end point
+        return self._path_curve_to(tokens, i, state, relative, 6, 4)
+
+    def _path_quadratic(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        # Quadratic bezier (4 params)
+        return self._path_curve_to(tokens, i, state, relative, 4, 2)
+
+    def _path_smooth(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        # Smooth curves (4 or 2 params): go to the first coordinate pair
+        return self._path_curve_to(tokens, i, state, relative, 2, 0)
+
+    def _path_arc(self, tokens: list[str], i: int, state: "_PathState", relative: bool) -> int:
+        # Arc - simplified, skip all arc parameters
+        return i + 7
+
+    # Path command letter -> (handler, relative)
+    _PATH_COMMANDS = {
+        "M": (_path_move, False), "m": (_path_move, True),
+        "L": (_path_line, False), "l": (_path_line, True),
+        "H": (_path_horizontal, False), "h": (_path_horizontal, True),
+        "V": (_path_vertical, False), "v": (_path_vertical, True),
+        "Z": (_path_close, False), "z": (_path_close, True),
+        "C": (_path_cubic, False), "c": (_path_cubic, True),
+        "Q": (_path_quadratic, False), "q": (_path_quadratic, True),
+        "S": (_path_smooth, False), "s": (_path_smooth, True),
+        "T": (_path_smooth, False), "t": (_path_smooth, True),
+        "A": (_path_arc, False), "a": (_path_arc, True),
+    }
 
     def draw_text(self, object_id: str, x: float, y: float, text: str,
                   fill: str = "black", font_size: str = "16px") -> bool:
@@ -615,21 +750,83 @@ Example valid elements:
             self.get_or_create_group(object_id)
             tx, ty = self._svg_to_turtle_coords(x, y)
 
-            # Parse font size
-            size = 16
-            if font_size:
-                size_match = re.match(r'(\d+)', font_size)
-                if size_match:
-                    size = int(size_match.group(1))
+            size = _parse_font_size(font_size)
 
             fill_color = self._parse_color(fill) or "black"
 
             self.turtle.penup()
             self.turtle.goto(tx, ty)
-            self.turtle.pencolor(fill_color)
+            self._set_pen_color(fill_color)
             self.turtle.write(text, font=("Arial", size, "normal"))
 
-            self.object_groups[object_id].append(("text", {"x": x, "y": y, "text": text}))
+            if self._track_groups:
+                self.object_groups[object_id].append(("text", {"x": x, "y": y, "text": text}))
+            return True
+        except Exception:
+            return False
+
+    # === Direct canvas drawing (DrawingConfig.direct_canvas) ===
+
+    def _canvas_coords(self, points) -> list[float]:
+        """Flatten SVG points into Tk canvas coordinates (turtle world coordinates scaled, y pointing down)."""
+        half_width, half_height = self._half_width, self._half_height
+        xscale, yscale = self._canvas_scale
+        # Vertex count is known: allocate the flat list once and fill the x and y slots by slice
+        coords = [0.0] * (2 * len(points))
+        coords[0::2] = [(x - half_width) * xscale for x, _ in points]
+        coords[1::2] = [(y - half_height) * yscale for _, y in points]
+        return coords
+
+    def _canvas_circle(self, object_id: str, cx: float, cy: float, r: float,
+                       fill: str, stroke: str, stroke_width: float) -> bool:
+        try:
+            self.get_or_create_group(object_id)
+            box = self._canvas_coords(((cx - r, cy - r), (cx + r, cy + r)))
+            self._canvas.create_oval(*box, fill=self._parse_color(fill), outline=self._parse_color(stroke), width=stroke_width)
+            if self._track_groups:
+                self.object_groups[object_id].append(("circle", {"cx": cx, "cy": cy, "r": r}))
+            return True
+        except Exception:
+            return False
+
+    def _canvas_line(self, object_id: str, x1: float, y1: float, x2: float, y2: float,
+                     stroke: str, stroke_width: float) -> bool:
+        try:
+            self.get_or_create_group(object_id)
+            coords = self._canvas_coords(((x1, y1), (x2, y2)))
+            self._canvas.create_line(*coords, fill=self._parse_color(stroke) or "black", width=stroke_width, capstyle="round")
+            if self._track_groups:
+                self.object_groups[object_id].append(("line", {"x1": x1, "y1": y1, "x2": x2, "y2": y2}))
+            return True
+        except Exception:
+            return False
+
+    def _canvas_polyline(self, object_id: str, points: list[tuple[float, float]],
+                         fill: str, stroke: str, stroke_width: float) -> bool:
+        try:
+            self.get_or_create_group(object_id)
+            coords = self._canvas_coords(points)
+            fill_color = self._parse_color(fill)
+            stroke_color = self._parse_color(stroke)
+            # Like the turtle version, a filled polyline fills the area it encloses but only strokes the open line
+            if fill_color:
+                self._canvas.create_polygon(*coords, fill=fill_color, outline="")
+            if stroke_color and len(coords) >= 4:
+                self._canvas.create_line(*coords, fill=stroke_color, width=stroke_width, capstyle="round")
+            if self._track_groups:
+                self.object_groups[object_id].append(("polyline", {"points": points}))
+            return True
+        except Exception:
+            return False
+
+    def _canvas_polygon(self, object_id: str, points: list[tuple[float, float]],
+                        fill: str, stroke: str, stroke_width: float) -> bool:
+        try:
+            self.get_or_create_group(object_id)
+            coords = self._canvas_coords(points)
+            self._canvas.create_polygon(*coords, fill=self._parse_color(fill), outline=self._parse_color(stroke), width=stroke_width)
+            if self._track_groups:
+                self.object_groups[object_id].append(("polygon", {"points": points}))
             return True
         except Exception:
             return False
@@ -666,4 +863,6 @@ Example valid elements:
             pass
         self.screen = None
         self.turtle = None
+        self._canvas = None
+        self._reset_pen_state()
         self._initialized = False